@@ -7,41 +7,37 @@ assignment: "Each state has a flag, anthem and capital".
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+import sys
 from dataclasses import dataclass
+from typing import Protocol
 
 
 # --- Abstract product definitions -------------------------------------------------
 
 
-class Flag(ABC):
+class Flag(Protocol):
     """Represents a country flag."""
 
-    @abstractmethod
     def description(self) -> str:
         """Return a human friendly description of the flag."""
 
-    @abstractmethod
     def emoji(self) -> str:
         """Return an emoji representation of the flag."""
 
 
-class Anthem(ABC):
+class Anthem(Protocol):
     """Represents a country anthem."""
 
-    @abstractmethod
     def title(self) -> str:
         """Return the official title of the anthem."""
 
 
-class Capital(ABC):
+class Capital(Protocol):
     """Represents a country capital city."""
 
-    @abstractmethod
     def name(self) -> str:
         """Return the capital's name."""
 
-    @abstractmethod
     def population(self) -> int:
         """Return the estimated population of the capital."""
 
@@ -49,18 +45,15 @@ class Capital(ABC):
 # --- Abstract factory definition --------------------------------------------------
 
 
-class CountryFactory(ABC):
+class CountryFactory(Protocol):
     """Abstract factory for creating country specific objects."""
 
-    @abstractmethod
     def create_flag(self) -> Flag:
         """Create the flag for the country."""
 
-    @abstractmethod
     def create_anthem(self) -> Anthem:
         """Create the anthem for the country."""
 
-    @abstractmethod
     def create_capital(self) -> Capital:
         """Create the capital for the country."""
 
@@ -68,8 +61,8 @@ class CountryFactory(ABC):
 # --- Concrete product implementations --------------------------------------------
 
 
-@dataclass(frozen=True)
-class SimpleFlag(Flag):
+@dataclass(frozen=True, slots=True)
+class SimpleFlag:
     description_text: str
     emoji_text: str
 
@@ -80,16 +73,16 @@ class SimpleFlag(Flag):
         return self.emoji_text
 
 
-@dataclass(frozen=True)
-class SimpleAnthem(Anthem):
+@dataclass(frozen=True, slots=True)
+class SimpleAnthem:
     anthem_title: str
 
     def title(self) -> str:
         return self.anthem_title
 
 
-@dataclass(frozen=True)
-class SimpleCapital(Capital):
+@dataclass(frozen=True, slots=True)
+class SimpleCapital:
     city_name: str
     estimated_population: int
 
@@ -100,76 +93,106 @@ class SimpleCapital(Capital):
         return self.estimated_population
 
 
+# --- Shared product instances ----------------------------------------------------
+
+# Products are immutable, so every factory call can hand out the same object.
+
+_RU_FLAG = SimpleFlag(
+    description_text="Три горизонтальные полосы: белая, синяя, красная.",
+    emoji_text="🇷🇺",
+)
+_RU_ANTHEM = SimpleAnthem("Государственный гимн Российской Федерации")
+_RU_CAPITAL = SimpleCapital("Москва", 12680000)
+
+_CN_FLAG = SimpleFlag(
+    description_text=(
+        "Красное полотнище с одной большой и четырьмя меньшими"
+        " звездами."
+    ),
+    emoji_text="🇨🇳",
+)
+_CN_ANTHEM = SimpleAnthem("Марш добровольцев")
+_CN_CAPITAL = SimpleCapital("Пекин", 21890000)
+
+_IN_FLAG = SimpleFlag(
+    description_text=(
+        "Три горизонтальные полосы: шафрановая, белая с синим колесом"
+        " Ашоки, зеленая."
+    ),
+    emoji_text="🇮🇳",
+)
+_IN_ANTHEM = SimpleAnthem("Джана-гана-мана")
+_IN_CAPITAL = SimpleCapital("Нью-Дели", 16790000)
+
+
 # --- Concrete factories -----------------------------------------------------------
 
 
-class RussiaFactory(CountryFactory):
+class RussiaFactory:
     def create_flag(self) -> Flag:
-        return SimpleFlag(
-            description_text="Три горизонтальные полосы: белая, синяя, красная.",
-            emoji_text="🇷🇺",
-        )
+        return _RU_FLAG
 
     def create_anthem(self) -> Anthem:
-        return SimpleAnthem("Государственный гимн Российской Федерации")
+        return _RU_ANTHEM
 
     def create_capital(self) -> Capital:
-        return SimpleCapital("Москва", 12680000)
+        return _RU_CAPITAL
 
 
-class ChinaFactory(CountryFactory):
+class ChinaFactory:
     def create_flag(self) -> Flag:
-        return SimpleFlag(
-            description_text=(
-                "Красное полотнище с одной большой и четырьмя меньшими"
-                " звездами." 
-            ),
-            emoji_text="🇨🇳",
-        )
+        return _CN_FLAG
 
     def create_anthem(self) -> Anthem:
-        return SimpleAnthem("Марш добровольцев")
+        return _CN_ANTHEM
 
     def create_capital(self) -> Capital:
-        return SimpleCapital("Пекин", 21890000)
+        return _CN_CAPITAL
 
 
-class IndiaFactory(CountryFactory):
+class IndiaFactory:
     def create_flag(self) -> Flag:
-        return SimpleFlag(
-            description_text=(
-                "Три горизонтальные полосы: шафрановая, белая с синим колесом"
-                " Ашоки, зеленая."
-            ),
-            emoji_text="🇮🇳",
-        )
+        return _IN_FLAG
 
     def create_anthem(self) -> Anthem:
-        return SimpleAnthem("Джана-гана-мана")
+        return _IN_ANTHEM
 
     def create_capital(self) -> Capital:
-        return SimpleCapital("Нью-Дели", 16790000)
+        return _IN_CAPITAL
 
 
 # --- Application logic ------------------------------------------------------------
 
 
-COUNTRY_FACTORIES: dict[str, CountryFactory] = {
-    "Россия": RussiaFactory(),
-    "Китай": ChinaFactory(),
-    "Индия": IndiaFactory(),
-}
+# Replaces the "," thousands separator with a space in a single pass.
+_THOUSANDS_TRANS = str.maketrans({",": " "})
+
+
+def _build_country_factories() -> dict[str, CountryFactory]:
+    factories: dict[str, CountryFactory] = {
+        "Россия": RussiaFactory(),
+        "Китай": ChinaFactory(),
+        "Индия": IndiaFactory(),
+    }
+    return {sys.intern(name): factory for name, factory in factories.items()}
+
+
+# Cyrillic keys are not interned automatically; interning them (and the user's
+# input) lets dict probes succeed on an identity check.
+COUNTRY_FACTORIES: dict[str, CountryFactory] = _build_country_factories()
+
+_COUNTRY_NAMES = tuple(COUNTRY_FACTORIES)
+_COUNTRY_PROMPT = f"Выберите страну ({', '.join(_COUNTRY_NAMES)}): "
 
 
-def get_country_choice() -> str:
-    """Prompt the user to choose a country from the available factories."""
+def get_country_choice() -> tuple[str, CountryFactory]:
+    """Prompt the user to choose a country and return it with its factory."""
 
-    options = list(COUNTRY_FACTORIES.keys())
-    options_display = ", ".join(options)
     while True:
-        choice = input(f"Выберите страну ({options_display}): ").strip()
-        if choice in COUNTRY_FACTORIES:
-            return choice
+        choice = sys.intern(input(_COUNTRY_PROMPT).strip())
+        factory = COUNTRY_FACTORIES.get(choice)
+        if factory is not None:
+            return choice, factory
         print("Неизвестная страна. Попробуйте снова.")
 
 
@@ -183,16 +206,13 @@ def show_country_info(factory: CountryFactory) -> None:
     print("Символика страны:")
     print(f"Флаг: {flag.description()}")
     print(f"Гимн: {anthem.title()}")
-    print(
-        "Столица: "
-        f"{capital.name()} (население ≈ {capital.population():,} человек)".replace(",", " ")
-    )
+    population = format(capital.population(), ",d").translate(_THOUSANDS_TRANS)
+    print(f"Столица: {capital.name()} (население ≈ {population} человек)")
     print("\n")
 
 
 if __name__ == "__main__":
-    for name in COUNTRY_FACTORIES:
+    for name, factory in COUNTRY_FACTORIES.items():
         print(name)
-        factory = COUNTRY_FACTORIES[name]
         show_country_info(factory)
 
@@ -1,53 +1,147 @@
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import cached_property
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# Indentation prefixes for the nesting depths used by the fleet tree.
+_INDENTS = tuple(" " * width for width in range(16))
+
+# Available energy sources paired with the name of their fleet group.
+_ENERGY_SOURCES: Tuple[Tuple[str, str], ...] = (
+    ("электричество", "Электричество"),
+    ("бензин", "Бензин"),
+    ("газ", "Газ"),
+    ("гибрид", "Гибрид"),
+)
+
+
+def _indent(width: int) -> str:
+    return _INDENTS[width] if width < len(_INDENTS) else " " * width
 
 
 class FleetComponent(ABC):
     """Base component for fleet items."""
 
-    @abstractmethod
     def display(self, indent: int = 0) -> str:
         """Return a string representation of the component."""
+        buf: List[str] = []
+        self._display_into(buf, indent)
+        return "\n".join(buf)
 
-    def add(self, component: "FleetComponent") -> None:
-        raise NotImplementedError("Cannot add child to a leaf component")
+    @abstractmethod
+    def _display_into(self, buf: List[str], indent: int) -> None:
+        """Append the component's lines to a shared output buffer."""
+
+
+class CompositeComponent(FleetComponent):
+    """Base for components that can hold children."""
+
+    @abstractmethod
+    def add(self, component: FleetComponent) -> None:
+        """Attach a child component."""
 
-    def remove(self, component: "FleetComponent") -> None:
-        raise NotImplementedError("Cannot remove child from a leaf component")
+    @abstractmethod
+    def remove(self, component: FleetComponent) -> None:
+        """Detach a child component."""
 
 
-class FleetGroup(FleetComponent):
+class FleetGroup(CompositeComponent):
     """Composite that can contain other components."""
 
     def __init__(self, name: str) -> None:
-        self.name = name
-        self._children: List[FleetComponent] = []
-
-    def add(self, component: FleetComponent) -> None:  # type: ignore[override]
-        self._children.append(component)
+        self._name = name
+        # Keyed by id() for O(1) removal, so each object appears at most once;
+        # dicts keep insertion order for display.
+        self._children: Dict[int, FleetComponent] = {}
+        self._parent: Optional[FleetGroup] = None
+        # Rendered subtree, reset whenever this group or a descendant changes.
+        self._cached_display: Optional[str] = None
+        self._cached_indent = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = value
+        self._invalidate()
+
+    def add(self, component: FleetComponent) -> None:
+        """Attach a child; re-adding the same object keeps its original position.
+
+        A group has a single parent, so adding it elsewhere moves it and the
+        cached output of both parents is refreshed:
+
+        >>> root, other, group = FleetGroup("R"), FleetGroup("O"), FleetGroup("G")
+        >>> root.add(group)
+        >>> print(root.display())
+        R:
+          G:
+        >>> other.add(group)
+        >>> group.add(Vehicle("c", "d"))
+        >>> print(root.display())
+        R:
+        >>> group.name = "GG"
+        >>> print(other.display())
+        O:
+          GG:
+            c (d)
+        """
+        if isinstance(component, FleetGroup):
+            previous = component._parent
+            if previous is not None and previous is not self:
+                previous.remove(component)
+            component._parent = self
+        self._children[id(component)] = component
+        self._invalidate()
+
+    def remove(self, component: FleetComponent) -> None:
+        """Detach a child by identity; unknown components are ignored."""
+        if self._children.pop(id(component), None) is None:
+            return
+        if isinstance(component, FleetGroup):
+            component._parent = None
+        self._invalidate()
 
-    def remove(self, component: FleetComponent) -> None:  # type: ignore[override]
-        self._children.remove(component)
+    def _invalidate(self) -> None:
+        group: Optional[FleetGroup] = self
+        while group is not None:
+            group._cached_display = None
+            group = group._parent
 
     def display(self, indent: int = 0) -> str:
-        lines = [" " * indent + f"{self.name}:"]
-        for child in self._children:
-            lines.append(child.display(indent + 2))
-        return "\n".join(lines)
+        if self._cached_display is None or indent != self._cached_indent:
+            self._cached_display = super().display(indent)
+            self._cached_indent = indent
+        return self._cached_display
+
+    def _display_into(self, buf: List[str], indent: int) -> None:
+        if self._cached_display is not None and indent == self._cached_indent:
+            buf.append(self._cached_display)
+            return
+        buf.append(f"{_indent(indent)}{self.name}:")
+        for child in self._children.values():
+            child._display_into(buf, indent + 2)
 
 
-@dataclass
+@dataclass(frozen=True)
 class Vehicle(FleetComponent):
     """Leaf node representing a vehicle."""
 
     name: str
     energy_source: str
 
-    def display(self, indent: int = 0) -> str:
-        return " " * indent + f"{self.name} ({self.energy_source})"
+    @cached_property
+    def _label(self) -> str:
+        return f"{self.name} ({self.energy_source})"
+
+    def _display_into(self, buf: List[str], indent: int) -> None:
+        buf.append(_indent(indent) + self._label)
 
 
 class FleetConsoleApp:
@@ -56,25 +150,39 @@ class FleetConsoleApp:
     def __init__(self) -> None:
         self.root_group = FleetGroup("Автопарк")
         self.energy_groups: dict[str, FleetGroup] = {}
+        self._menu_str = (
+            "\nВыберите действие:\n"
+            "1. Добавить автобус\n"
+            "2. Показать структуру автопарка\n"
+            "3. Выйти\n"
+        )
+        # A handler returning False stops the main loop.
+        self._handlers: dict[str, Callable[[], Optional[bool]]] = {
+            "1": self._handle_add_vehicle,
+            "2": self._show,
+            "3": self._quit,
+        }
 
     def run(self) -> None:
         print("Добро пожаловать в систему управления автопарком!")
         while True:
-            print("\nВыберите действие:")
-            print("1. Добавить автобус")
-            print("2. Показать структуру автопарка")
-            print("3. Выйти")
-            choice = input("> ").strip()
-
-            if choice == "1":
-                self._handle_add_vehicle()
-            elif choice == "2":
-                print("\n" + self.root_group.display())
-            elif choice == "3":
-                print("До свидания!")
-                break
-            else:
+            self._print_menu()
+            handler = self._handlers.get(input("> ").strip())
+            if handler is None:
                 print("Неизвестная команда. Попробуйте снова.")
+                continue
+            if handler() is False:
+                break
+
+    def _print_menu(self) -> None:
+        sys.stdout.write(self._menu_str)
+
+    def _show(self) -> None:
+        print("\n" + self.root_group.display())
+
+    def _quit(self) -> bool:
+        print("До свидания!")
+        return False
 
     def _handle_add_vehicle(self) -> None:
         name = input("Введите название автобуса: ").strip()
@@ -82,40 +190,37 @@ class FleetConsoleApp:
             print("Название автобуса не может быть пустым.")
             return
 
-        energy_source = self._ask_energy_source()
-        if energy_source is None:
+        source = self._ask_energy_source()
+        if source is None:
             return
 
-        group = self._get_or_create_energy_group(energy_source)
+        energy_source, group_name = source
+        group = self._get_or_create_energy_group(energy_source, group_name)
         group.add(Vehicle(name=name, energy_source=energy_source))
         print(f"Автобус '{name}' с источником энергии '{energy_source}' добавлен в автопарк.")
 
-    def _ask_energy_source(self) -> Optional[str]:
-        sources = [
-            "электричество",
-            "бензин",
-            "газ",
-            "гибрид",
-        ]
+    def _ask_energy_source(self) -> Optional[Tuple[str, str]]:
         print("Выберите источник энергии:")
-        for idx, source in enumerate(sources, start=1):
+        for idx, (source, _) in enumerate(_ENERGY_SOURCES, start=1):
             print(f"{idx}. {source}")
         choice = input("> ").strip()
-        if not choice.isdigit():
+        try:
+            index = int(choice) - 1
+        except ValueError:
             print("Нужно ввести номер варианта.")
             return None
-        index = int(choice) - 1
-        if index < 0 or index >= len(sources):
+        if index < 0 or index >= len(_ENERGY_SOURCES):
             print("Нет такого источника энергии.")
             return None
-        return sources[index]
+        return _ENERGY_SOURCES[index]
 
-    def _get_or_create_energy_group(self, energy_source: str) -> FleetGroup:
-        if energy_source not in self.energy_groups:
-            group = FleetGroup(energy_source.capitalize())
+    def _get_or_create_energy_group(self, energy_source: str, group_name: str) -> FleetGroup:
+        group = self.energy_groups.get(energy_source)
+        if group is None:
+            group = FleetGroup(group_name)
             self.energy_groups[energy_source] = group
             self.root_group.add(group)
-        return self.energy_groups[energy_source]
+        return group
 
 
 def main() -> None:
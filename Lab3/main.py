@@ -1,18 +1,20 @@
 """Console application demonstrating Strategy pattern for hero movement."""
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import Callable, Dict, Type
+from typing import Dict, Mapping, Tuple, Type
 
 
 class MovementStrategy:
     """Base class for movement strategies."""
 
     title: str = "movement"
+    _TEMPLATE: str = "%s moves."
 
     def move(self, hero_name: str) -> str:
         """Return a description of how the hero moves."""
-        raise NotImplementedError
+        return self._TEMPLATE % hero_name
 
     def __str__(self) -> str:  # pragma: no cover - trivial wrapper
         return self.title
@@ -20,26 +22,20 @@ class MovementStrategy:
 
 class WalkStrategy(MovementStrategy):
     title = "пешком"
-
-    def move(self, hero_name: str) -> str:
-        return f"{hero_name} идет неспешным шагом."
+    _TEMPLATE = "%s идет неспешным шагом."
 
 
 class RunStrategy(MovementStrategy):
     title = "бегом"
-
-    def move(self, hero_name: str) -> str:
-        return f"{hero_name} стремительно бежит вперед."
+    _TEMPLATE = "%s стремительно бежит вперед."
 
 
 class SwimStrategy(MovementStrategy):
     title = "плывет"
-
-    def move(self, hero_name: str) -> str:
-        return f"{hero_name} уверенно плывет по воде."
+    _TEMPLATE = "%s уверенно плывет по воде."
 
 
-@dataclass
+@dataclass(slots=True)
 class Hero:
     """Base hero with ability to switch movement strategies."""
 
@@ -56,42 +52,51 @@ class Hero:
 
 
 class King(Hero):
-    pass
+    __slots__ = ()
 
 
 class Warrior(Hero):
-    pass
+    __slots__ = ()
 
 
 class Mage(Hero):
-    pass
+    __slots__ = ()
 
 
-HERO_TYPES: Dict[str, Callable[[MovementStrategy], Hero]] = {
-    "король": lambda strategy: King("Король Артур", strategy),
-    "воин": lambda strategy: Warrior("Воин Бьорн", strategy),
-    "маг": lambda strategy: Mage("Маг Элоин", strategy),
+HERO_TYPES: Dict[str, Tuple[Type[Hero], str]] = {
+    sys.intern(name): hero_spec
+    for name, hero_spec in {
+        "король": (King, "Король Артур"),
+        "воин": (Warrior, "Воин Бьорн"),
+        "маг": (Mage, "Маг Элоин"),
+    }.items()
 }
 
 
-STRATEGIES: Dict[str, Type[MovementStrategy]] = {
-    "ходьба": WalkStrategy,
-    "бег": RunStrategy,
-    "плавание": SwimStrategy,
+# Strategies are stateless, so a single shared instance of each is enough.
+STRATEGIES: Dict[str, MovementStrategy] = {
+    sys.intern(name): strategy
+    for name, strategy in {
+        "ходьба": WalkStrategy(),
+        "бег": RunStrategy(),
+        "плавание": SwimStrategy(),
+    }.items()
 }
 
 
-def choose_option(options: Dict[str, Callable], prompt: str) -> str:
+def choose_option(options: Mapping[str, object], prompt: str) -> str:
     items = list(options.keys())
+    menu = "\n".join(
+        [prompt, *(f"  {index}. {title}" for index, title in enumerate(items, start=1))]
+    ) + "\n"
     while True:
-        print(prompt)
-        for index, title in enumerate(items, start=1):
-            print(f"  {index}. {title}")
+        sys.stdout.write(menu)
         selection = input("Введите номер варианта: ").strip()
-        if not selection.isdigit():
+        try:
+            index = int(selection) - 1
+        except ValueError:
             print("Введите номер из списка.\n")
             continue
-        index = int(selection) - 1
         if not 0 <= index < len(items):
             print("Вариант вне диапазона. Попробуйте снова.\n")
             continue
@@ -103,10 +108,11 @@ def main() -> None:
     strategy_name = choose_option(
         STRATEGIES, "Выберите начальную стратегию передвижения:"
     )
-    strategy = STRATEGIES[strategy_name]()
+    strategy = STRATEGIES[strategy_name]
 
     hero_type_name = choose_option(HERO_TYPES, "Выберите тип героя:")
-    hero = HERO_TYPES[hero_type_name](strategy)
+    hero_cls, hero_name = HERO_TYPES[hero_type_name]
+    hero = hero_cls(hero_name, strategy)
 
     print(f"\n{hero.name} использует стратегию '{hero.movement_strategy}'.")
     print(hero.perform_move())
@@ -120,7 +126,7 @@ def main() -> None:
             new_strategy_name = choose_option(
                 STRATEGIES, "Выберите новую стратегию передвижения:"
             )
-            hero.set_strategy(STRATEGIES[new_strategy_name]())
+            hero.set_strategy(STRATEGIES[new_strategy_name])
             print(f"\n{hero.name} теперь {hero.movement_strategy}.")
             print(hero.perform_move())
         elif choice == "2":